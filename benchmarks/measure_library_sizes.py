@@ -7,12 +7,17 @@ This helps determine deployment footprint for each client API.
 import os
 import sys
 import json
+import zlib
 from pathlib import Path
 import subprocess
 
 
-def get_directory_size(path):
-    """Calculate total size of a directory in bytes."""
+def get_directory_size(path: str) -> int:
+    """Calculate total size of a directory in bytes.
+
+    Works on plain path strings (``entry.path``) to avoid building a Path
+    object for every directory visited.
+    """
     total = 0
     try:
         for entry in os.scandir(path):
@@ -46,7 +51,7 @@ def measure_python_kuzu():
         kuzu_path = Path(kuzu.__file__).parent
 
         # Get total package size
-        total_size = get_directory_size(kuzu_path)
+        total_size = get_directory_size(os.fspath(kuzu_path))
 
         # Find .so files (native libraries)
         so_files = (
@@ -93,7 +98,7 @@ def measure_nodejs_kuzu():
         return None
 
     # Get total package size
-    total_size = get_directory_size(node_modules)
+    total_size = get_directory_size(os.fspath(node_modules))
 
     # Find native bindings
     native_files = (
@@ -146,13 +151,13 @@ def measure_wasm_kuzu():
 
         # Try to get gzipped size
         try:
-            import gzip
-            import io
-
+            # wbits=31 selects the gzip container; only the length is needed
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+            gzipped_size = 0
             with open(wasm_file, "rb") as f:
-                with gzip.open(io.BytesIO(), "wb") as gz:
-                    gz.write(f.read())
-                    gzipped_size = gz.tell()
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    gzipped_size += len(compressor.compress(chunk))
+            gzipped_size += len(compressor.flush())
         except Exception:
             gzipped_size = None
 
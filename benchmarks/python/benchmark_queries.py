@@ -9,18 +9,32 @@ Tests common Zanzibar-style authorization patterns:
 - Reverse lookups (who has access)
 """
 
+import hashlib
+import os
+import threading
 import time
-import random
-import json
-import statistics
 from pathlib import Path
-from typing import Dict, List, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 import kuzu
+import numpy as np
+import orjson
 
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # pybloom_live is optional; an exact set is used instead
+    ScalableBloomFilter = None
 
-@dataclass
+
+def _reduce(times: np.ndarray) -> Tuple[float, ...]:
+    """Return sum, mean, min, max, p50, p95 and p99 of per-iteration times."""
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return times.sum(), times.mean(), times.min(), times.max(), p50, p95, p99
+
+
+@dataclass(slots=True, frozen=True)
 class QueryResult:
     """Store query benchmark results."""
 
@@ -35,53 +49,85 @@ class QueryResult:
     p95_time_ms: float
     p99_time_ms: float
     results_count: int
+    threads: int
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "query_name": self.query_name,
+            "query": self.query,
+            "iterations": self.iterations,
+            "total_time_sec": self.total_time_sec,
+            "avg_time_ms": self.avg_time_ms,
+            "min_time_ms": self.min_time_ms,
+            "max_time_ms": self.max_time_ms,
+            "p50_time_ms": self.p50_time_ms,
+            "p95_time_ms": self.p95_time_ms,
+            "p99_time_ms": self.p99_time_ms,
+            "results_count": self.results_count,
+            "threads": self.threads,
+        }
 
 
 class AuthorizationBenchmark:
     """Benchmark authorization query patterns."""
 
-    def __init__(self, db_path: Path):
+    # p50/p95 slowdown against the cached baseline that is reported as a regression
+    REGRESSION_THRESHOLD = 0.20
+
+    def __init__(
+        self,
+        db_path: Path,
+        consume_mode: str = "arrow",
+        threads: Optional[int] = None,
+        concurrency: int = 0,
+    ):
+        """
+        Args:
+            db_path: Path to an existing KuzuDB database
+            consume_mode: 'arrow' to fetch results as one Arrow table,
+                'rows' to iterate them row by row through get_next()
+            threads: Worker threads per query (defaults to all CPU cores)
+            concurrency: Run independent benchmarks on this many connections
+                at once (0 or 1 keeps every benchmark serial on one connection)
+        """
         self.db_path = db_path
         self.db = kuzu.Database(str(db_path))
-        self.conn = kuzu.Connection(self.db)
+        self.threads = threads or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.conn = self._connect()
+        self.consume_mode = consume_mode
         self.results = []
+        # Batched, LIMIT 1 and client-filtered variants of the core queries.
+        # They do not measure the same work as the other platforms' queries,
+        # so they are saved apart from the results the report compares.
+        self.variant_results = []
+        # Prepared statements keyed by template text, shared across benchmarks
+        self._prepared: Dict[str, kuzu.PreparedStatement] = {}
 
         # Sample IDs for testing (will be populated from database)
-        self.sample_users = []
-        self.sample_resources = []
-        self.sample_groups = []
+        self.sample_users = np.array([], dtype=str)
+        self.sample_resources = np.array([], dtype=str)
+        self.sample_groups = np.array([], dtype=str)
+
+        # (user_id, resource_id) pairs with read access, see build_allow_filter
+        self.allow_filter = None
+
+        # Previous serial p50/p95 per benchmark, keyed by _stats_key
+        self.results_dir = Path(__file__).parent.parent.parent / "results"
+        self.stats_cache_file = self.results_dir / "query_stats_cache.json"
+        self.stats_cache: Dict[str, Dict[str, float]] = {}
+        if self.stats_cache_file.exists():
+            self.stats_cache = orjson.loads(self.stats_cache_file.read_bytes())
+        # Keys whose baseline is kept because this run regressed against it
+        self._regressed: Set[str] = set()
 
     def load_sample_ids(self, sample_size: int = 100):
         """Load random sample of IDs for testing."""
         print("Loading sample IDs for queries...")
 
-        # Sample users
-        result = self.conn.execute("MATCH (u:User) RETURN u.id LIMIT 1000")
-        all_users = []
-        while result.has_next():
-            all_users.append(result.get_next()[0])
-        self.sample_users = random.sample(all_users, min(sample_size, len(all_users)))
-
-        # Sample resources
-        result = self.conn.execute("MATCH (r:Resource) RETURN r.id LIMIT 1000")
-        all_resources = []
-        while result.has_next():
-            all_resources.append(result.get_next()[0])
-        self.sample_resources = random.sample(
-            all_resources, min(sample_size, len(all_resources))
-        )
-
-        # Sample groups
-        result = self.conn.execute("MATCH (g:UserGroup) RETURN g.id LIMIT 500")
-        all_groups = []
-        while result.has_next():
-            all_groups.append(result.get_next()[0])
-        self.sample_groups = random.sample(
-            all_groups, min(sample_size // 2, len(all_groups))
-        )
+        self.sample_users = self._sample_ids("User", sample_size)
+        self.sample_resources = self._sample_ids("Resource", sample_size)
+        self.sample_groups = self._sample_ids("UserGroup", sample_size // 2)
 
         print(
             f"  ✓ Loaded {len(self.sample_users)} users, "
@@ -89,21 +135,38 @@ class AuthorizationBenchmark:
             f"{len(self.sample_groups)} groups"
         )
 
+    def _sample_ids(self, label: str, k: int) -> np.ndarray:
+        """
+        Pick up to k random node ids of one label inside the database.
+
+        The ids come back as a fixed-width unicode array so drawing parameter
+        sets is plain strided indexing rather than a list of boxed strings.
+        """
+        result = self.conn.execute(
+            f"MATCH (n:{label}) RETURN n.id ORDER BY gen_random_uuid() LIMIT $k",
+            {"k": k},
+        )
+        return np.asarray(result.get_as_arrow().column(0).to_pylist(), dtype=str)
+
     def benchmark_query(
         self,
         query_name: str,
         query_template: str,
         params_list: List[Dict],
         warmup: int = 5,
+        conn: Optional[kuzu.Connection] = None,
+        variant: bool = False,
     ) -> QueryResult:
         """
         Benchmark a query with multiple parameter sets.
 
         Args:
             query_name: Descriptive name for the query
-            query_template: Cypher query (can include {param} placeholders)
+            query_template: Cypher query (can include $param placeholders)
             params_list: List of parameter dictionaries
             warmup: Number of warmup iterations
+            conn: Connection to run on (defaults to the shared self.conn)
+            variant: Store the result with variant_results
         """
         print(f"\n{'='*60}")
         print(f"Benchmarking: {query_name}")
@@ -113,50 +176,297 @@ class AuthorizationBenchmark:
             print("  ⚠️  No parameters provided, skipping")
             return None
 
+        # Parse and plan once; every iteration only binds parameters.
+        # Prepared statements belong to one connection, so only the shared
+        # connection's are cached.
+        if conn is None or conn is self.conn:
+            conn = self.conn
+            prepared = self._prepare(query_template)
+        else:
+            prepared = conn.prepare(query_template)
+
         # Warmup
         print(f"Warming up ({warmup} iterations)...")
-        for i in range(min(warmup, len(params_list))):
-            query = query_template.format(**params_list[i])
-            result = self.conn.execute(query)
-            # Consume results
-            while result.has_next():
-                result.get_next()
+        self._warmup(conn, query_template, prepared, params_list[:warmup])
 
         # Actual benchmark
         print(f"Running benchmark ({len(params_list)} iterations)...")
-        times = []
+        times = np.empty(len(params_list), dtype=np.float64)
         total_results = 0
 
-        for params in params_list:
-            query = query_template.format(**params)
-
+        for i, params in enumerate(params_list):
             start = time.perf_counter()
-            result = self.conn.execute(query)
+            result = conn.execute(prepared, params)
 
             # Consume all results
-            count = 0
-            while result.has_next():
-                result.get_next()
-                count += 1
+            count = self._consume(result)
 
             elapsed = time.perf_counter() - start
-            times.append(elapsed * 1000)  # Convert to milliseconds
+            times[i] = elapsed * 1000  # Convert to milliseconds
             total_results += count
 
-        # Calculate statistics
-        times.sort()
-        total_time = sum(times) / 1000  # Convert back to seconds
-        avg_time = statistics.mean(times)
-        min_time = min(times)
-        max_time = max(times)
-        p50 = times[len(times) // 2]
-        p95 = times[int(len(times) * 0.95)]
-        p99 = times[int(len(times) * 0.99)]
+        return self._record_result(
+            query_name, query_template, times, total_results, variant=variant
+        )
+
+    def benchmark_batch_query(
+        self,
+        query_name: str,
+        query_template: str,
+        batch_param: str,
+        values: List,
+        rounds: int = 5,
+        warmup: int = 1,
+    ) -> QueryResult:
+        """
+        Benchmark an UNWIND query that handles a whole batch in one execution.
+
+        Args:
+            query_name: Descriptive name for the query
+            query_template: Cypher query that UNWINDs the list in $<batch_param>
+            batch_param: Name of the list parameter
+            values: Values to bind as the batch
+            rounds: Number of times the whole batch is executed
+            warmup: Number of warmup rounds
+        """
+        print(f"\n{'='*60}")
+        print(f"Benchmarking: {query_name}")
+        print("=" * 60)
+
+        if not values:
+            print("  ⚠️  No parameters provided, skipping")
+            return None
+
+        prepared = self._prepare(query_template)
+        params = {batch_param: values}
+
+        print(f"Warming up ({warmup} rounds)...")
+        for _ in range(warmup):
+            self._consume(self.conn.execute(prepared, params))
+
+        print(f"Running benchmark ({rounds} rounds of {len(values)} items)...")
+        times = np.empty(rounds, dtype=np.float64)
+        total_results = 0
+
+        for i in range(rounds):
+            start = time.perf_counter()
+            result = self.conn.execute(prepared, params)
+            count = self._consume(result)
+
+            elapsed = time.perf_counter() - start
+            times[i] = elapsed * 1000
+            total_results += count
+
+        result = self._record_result(
+            query_name, query_template, times, total_results, variant=True
+        )
+        print(
+            f"  Throughput: {len(values) * rounds / result.total_time_sec:.0f} items/sec"
+        )
+        return result
+
+    def build_allow_filter(self):
+        """
+        Record every (user, resource) read grant of the sampled users.
+
+        Uses a Bloom filter when pybloom_live is installed. A pair missing from
+        the filter is guaranteed to be denied, so negative checks never need to
+        reach the database; false positives only cost a regular query.
+        """
+        print("\nBuilding permission filter for sampled users...")
+        if ScalableBloomFilter is not None:
+            self.allow_filter = ScalableBloomFilter(
+                mode=ScalableBloomFilter.SMALL_SET_GROWTH
+            )
+        else:
+            self.allow_filter = set()
+
+        result = self.conn.execute(
+            """UNWIND $user_ids AS uid
+               MATCH (u:User {id: uid})-[p:HAS_PERMISSION_USER]->(r:Resource)
+               WHERE p.can_read = true
+               RETURN u.id, r.id
+               UNION
+               UNWIND $user_ids AS uid
+               MATCH (u:User {id: uid})-[:MEMBER_OF]->(g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource)
+               WHERE p.can_read = true
+               RETURN u.id, r.id""",
+            {"user_ids": self.sample_users.tolist()},
+        ).get_as_arrow()
+        for pair in zip(result.column(0).to_pylist(), result.column(1).to_pylist()):
+            self.allow_filter.add(pair)
+        print(f"  ✓ Recorded {result.num_rows:,} grants")
+
+    def benchmark_query_with_filter(
+        self,
+        query_name: str,
+        query_template: str,
+        params_list: List[Dict],
+        warmup: int = 5,
+    ) -> QueryResult:
+        """
+        Benchmark a user/resource check that consults allow_filter first.
+
+        Pairs absent from the filter are answered as denied without a query;
+        the rest run query_template as usual, after the same warmup as
+        benchmark_query.
+        """
+        print(f"\n{'='*60}")
+        print(f"Benchmarking: {query_name}")
+        print("=" * 60)
+
+        if not params_list or self.allow_filter is None:
+            print("  ⚠️  No parameters or filter provided, skipping")
+            return None
+
+        prepared = self._prepare(query_template)
+
+        print(f"Warming up ({warmup} iterations)...")
+        self._warmup(self.conn, query_template, prepared, params_list[:warmup])
+
+        print(f"Running benchmark ({len(params_list)} iterations)...")
+        times = np.empty(len(params_list), dtype=np.float64)
+        total_results = 0
+        short_circuited = 0
+
+        for i, params in enumerate(params_list):
+            start = time.perf_counter()
+            if (params["user_id"], params["resource_id"]) not in self.allow_filter:
+                count = 0
+                short_circuited += 1
+            else:
+                count = self._consume(self.conn.execute(prepared, params))
+            times[i] = (time.perf_counter() - start) * 1000
+            total_results += count
+
+        result = self._record_result(
+            query_name, query_template, times, total_results, variant=True
+        )
+        print(
+            f"  Filter hit rate: {short_circuited / len(params_list):.1%} "
+            f"answered without a query"
+        )
+        return result
+
+    def run_queries(self, jobs: List[Tuple[str, str, List[Dict]]]):
+        """
+        Run independent (query_name, query_template, params_list) benchmarks.
+
+        With concurrency > 1 the jobs are spread over a thread pool in which
+        every worker owns a Connection to the shared Database; results are
+        stored in submission order either way.
+        """
+        if self.concurrency < 2:
+            for job in jobs:
+                self.benchmark_query(*job)
+            return
+
+        local = threading.local()
+
+        def connect():
+            local.conn = self._connect()
+
+        def run(job):
+            return self.benchmark_query(*job, conn=local.conn)
+
+        first = len(self.results)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, initializer=connect
+        ) as executor:
+            futures = [executor.submit(run, job) for job in jobs]
+        elapsed = time.perf_counter() - start
+
+        # Workers append as they finish; restore the submission order
+        self.results[first:] = [f.result() for f in futures if f.result() is not None]
+        print(
+            f"\nRan {len(jobs)} benchmarks on {self.concurrency} connections "
+            f"in {elapsed:.3f}s wall clock"
+        )
+
+    def _warmup(
+        self,
+        conn: kuzu.Connection,
+        query_template: str,
+        prepared: kuzu.PreparedStatement,
+        warmup_params: List[Dict],
+    ):
+        """
+        Run the warmup parameter sets untimed, as one UNWIND execution if possible.
+
+        Templates whose meaning changes when their rows are merged across
+        parameter sets (UNION, LIMIT) are warmed one execution at a time.
+        A batched warmup is followed by one run of the prepared statement
+        itself, so the first timed iteration does not pay for its first use.
+        """
+        batched = None
+        if warmup_params and not any(kw in query_template for kw in ("UNION", "LIMIT")):
+            batched = query_template
+            for name in warmup_params[0]:
+                batched = batched.replace(f"${name}", f"b.{name}")
+            batched = f"UNWIND $batch AS b\n{batched}"
+
+        if batched is not None:
+            try:
+                self._consume(conn.execute(batched, {"batch": warmup_params}))
+                self._consume(conn.execute(prepared, warmup_params[0]))
+                return
+            except RuntimeError:
+                pass  # Not expressible as one batch; warm up per parameter set
+
+        for params in warmup_params:
+            self._consume(conn.execute(prepared, params))
+
+    def _connect(self) -> kuzu.Connection:
+        """Open a connection to the shared database with the configured threads."""
+        conn = kuzu.Connection(self.db)
+        conn.set_max_threads_for_exec(self.threads)
+        return conn
+
+    def _prepare(self, query_template: str) -> kuzu.PreparedStatement:
+        """Return the cached prepared statement for a template, preparing it once."""
+        prepared = self._prepared.get(query_template)
+        if prepared is None:
+            prepared = self._prepared[query_template] = self.conn.prepare(
+                query_template
+            )
+        return prepared
+
+    def _consume(self, result: kuzu.QueryResult) -> int:
+        """Materialize all rows of a query result and return the row count."""
+        if self.consume_mode == "arrow":
+            # One columnar fetch instead of a Python call per row
+            return result.get_as_arrow(chunk_size=10000).num_rows
+
+        count = 0
+        while result.has_next():
+            result.get_next()
+            count += 1
+        return count
+
+    def _record_result(
+        self,
+        query_name: str,
+        query_template: str,
+        times: np.ndarray,
+        total_results: int,
+        variant: bool = False,
+    ) -> QueryResult:
+        """
+        Compute statistics over per-iteration times (ms) and store the result.
+
+        Variant results go to variant_results instead of results.
+        """
+        # Calculate statistics (interpolated percentiles, no full sort)
+        total_ms, avg_time, min_time, max_time, p50, p95, p99 = (
+            float(v) for v in _reduce(times)
+        )
+        total_time = total_ms / 1000  # Convert back to seconds
 
         result = QueryResult(
             query_name=query_name,
             query=query_template,
-            iterations=len(params_list),
+            iterations=len(times),
             total_time_sec=total_time,
             avg_time_ms=avg_time,
             min_time_ms=min_time,
@@ -165,11 +475,12 @@ class AuthorizationBenchmark:
             p95_time_ms=p95,
             p99_time_ms=p99,
             results_count=total_results,
+            threads=self.threads,
         )
 
         # Print summary
         print(f"\nResults:")
-        print(f"  Iterations: {result.iterations}")
+        print(f"  Iterations: {result.iterations} ({result.threads} threads)")
         print(f"  Total time: {result.total_time_sec:.3f}s")
         print(f"  Average: {result.avg_time_ms:.3f}ms")
         print(f"  p50: {result.p50_time_ms:.3f}ms")
@@ -178,167 +489,259 @@ class AuthorizationBenchmark:
         print(f"  Min: {result.min_time_ms:.3f}ms")
         print(f"  Max: {result.max_time_ms:.3f}ms")
         print(f"  Avg results: {result.results_count / result.iterations:.1f}")
+        self._compare_to_baseline(result)
 
-        self.results.append(result)
+        (self.variant_results if variant else self.results).append(result)
         return result
 
+    @staticmethod
+    def _stats_key(query_name: str, query_template: str) -> str:
+        """Hash a benchmark's name and Cypher text into its stats cache key."""
+        # The name is included because some benchmarks share a template
+        text = f"{query_name}\n{query_template}"
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _compare_to_baseline(self, result: QueryResult):
+        """Print p50/p95 changes against the cached baseline, flagging regressions."""
+        if self.concurrency > 1:
+            return  # Latencies under contention are not comparable
+
+        key = self._stats_key(result.query_name, result.query)
+        baseline = self.stats_cache.get(key)
+        if not baseline or not baseline.get("p50") or not baseline.get("p95"):
+            print("  Baseline: none cached yet")
+            return
+
+        changes = {
+            "p50": result.p50_time_ms / baseline["p50"] - 1,
+            "p95": result.p95_time_ms / baseline["p95"] - 1,
+        }
+        regressed = [
+            f"{change:+.0%} {stat}"
+            for stat, change in changes.items()
+            if change > self.REGRESSION_THRESHOLD
+        ]
+        if regressed:
+            self._regressed.add(key)
+            print(f"  ⚠️  regression {', '.join(regressed)} vs cached baseline")
+        else:
+            print(f"  Baseline: {changes['p50']:+.1%} p50, {changes['p95']:+.1%} p95")
+
     def run_all_benchmarks(self):
         """Run all authorization query benchmarks."""
         print("\n" + "=" * 60)
         print("KuzuDB Authorization Query Benchmark Suite")
         print("=" * 60)
 
-        self.load_sample_ids()
-
-        # 1. Direct permission check: Does user X have permission Y on resource Z?
-        params = [
+        # 290 distinct users and 240 distinct resources are handed out below
+        self.load_sample_ids(sample_size=300)
+
+        # Shuffle the distinct sampled ids once with a seeded generator and
+        # give every benchmark its own range of them, so no benchmark runs on
+        # ids an earlier one already pulled into the caches. The pair
+        # benchmarks use the first 180 users and resources; single-id
+        # benchmarks take from the rest. Variants (3b, 3c, 4b) reuse the
+        # parameters of the query they are a variant of.
+        rng = np.random.default_rng(0)
+        # tolist() hands plain str ids to the Cypher parameters
+        users = rng.permutation(self.sample_users).tolist()
+        resources = rng.permutation(self.sample_resources).tolist()
+        ur_pairs = [
             {"user_id": user, "resource_id": resource}
-            for user, resource in zip(
-                random.choices(self.sample_users, k=50),
-                random.choices(self.sample_resources, k=50),
-            )
+            for user, resource in zip(users[:180], resources[:180])
         ]
+        user_params = [{"user_id": user} for user in users[180:]]
+        resource_params = [{"resource_id": resource} for resource in resources[180:]]
+
+        # 1. Direct permission check: Does user X have permission Y on resource Z?
+        params = ur_pairs[0:50]
         self.benchmark_query(
             "Direct Permission Check (Read)",
-            """MATCH (u:User {{id: '{user_id}'}})-[p:HAS_PERMISSION_USER]->(r:Resource {{id: '{resource_id}'}})
+            """MATCH (u:User {id: $user_id})-[p:HAS_PERMISSION_USER]->(r:Resource {id: $resource_id})
                WHERE p.can_read = true
                RETURN u.id, r.id""",
             params,
         )
 
         # 2. Group-based permission: Does user have access via groups?
-        params = [
-            {"user_id": user, "resource_id": resource}
-            for user, resource in zip(
-                random.choices(self.sample_users, k=50),
-                random.choices(self.sample_resources, k=50),
-            )
-        ]
+        params = ur_pairs[50:100]
         self.benchmark_query(
             "Group-Based Permission Check",
-            """MATCH (u:User {{id: '{user_id}'}})-[:MEMBER_OF]->(g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource {{id: '{resource_id}'}})
+            """MATCH (u:User {id: $user_id})-[:MEMBER_OF]->(g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource {id: $resource_id})
                WHERE p.can_read = true
                RETURN u.id, g.id, r.id""",
             params,
         )
 
         # 3. Combined permission check (direct OR via group)
-        params = [
-            {"user_id": user, "resource_id": resource}
-            for user, resource in zip(
-                random.choices(self.sample_users, k=50),
-                random.choices(self.sample_resources, k=50),
-            )
-        ]
+        # Each UNION branch is planned on its own, avoiding the expansion of two
+        # OPTIONAL MATCH legs. Previous baseline shape:
+        #   MATCH (u:User {id: $user_id})
+        #   MATCH (r:Resource {id: $resource_id})
+        #   OPTIONAL MATCH (u)-[p1:HAS_PERMISSION_USER]->(r)
+        #   OPTIONAL MATCH (u)-[:MEMBER_OF]->(g:UserGroup)-[p2:HAS_PERMISSION_GROUP]->(r)
+        #   WHERE (p1.can_read = true OR p2.can_read = true)
+        #   RETURN u.id, r.id
+        params = ur_pairs[100:150]
+        combined_check = """MATCH (u:User {id: $user_id})-[p:HAS_PERMISSION_USER]->(r:Resource {id: $resource_id})
+               WHERE p.can_read = true
+               RETURN u.id, r.id
+               UNION
+               MATCH (u:User {id: $user_id})-[:MEMBER_OF]->(g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource {id: $resource_id})
+               WHERE p.can_read = true
+               RETURN u.id, r.id"""
         self.benchmark_query(
-            "Combined Permission Check (Direct + Group)",
-            """MATCH (u:User {{id: '{user_id}'}})
-               MATCH (r:Resource {{id: '{resource_id}'}})
-               OPTIONAL MATCH (u)-[p1:HAS_PERMISSION_USER]->(r)
-               OPTIONAL MATCH (u)-[:MEMBER_OF]->(g:UserGroup)-[p2:HAS_PERMISSION_GROUP]->(r)
-               WHERE (p1.can_read = true OR p2.can_read = true)
-               RETURN u.id, r.id""",
-            params,
+            "Combined Permission Check (Direct + Group)", combined_check, params
         )
 
-        # 4. List all resources user can read
-        params = [{"user_id": user} for user in random.choices(self.sample_users, k=30)]
+        # 3b. Same check as a yes/no answer: each branch stops at its first match
         self.benchmark_query(
-            "List User's Readable Resources",
-            """MATCH (u:User {{id: '{user_id}'}})
-               MATCH (u)-[p:HAS_PERMISSION_USER]->(r:Resource)
+            "Combined Permission Check (Direct + Group, LIMIT 1)",
+            """MATCH (u:User {id: $user_id})-[p:HAS_PERMISSION_USER]->(r:Resource {id: $resource_id})
                WHERE p.can_read = true
-               RETURN r.id, r.type, r.name""",
-            params,
-        )
-
-        # 5. List all resources user can read (including via groups)
-        params = [{"user_id": user} for user in random.choices(self.sample_users, k=30)]
-        self.benchmark_query(
-            "List User's Readable Resources (Via Groups)",
-            """MATCH (u:User {{id: '{user_id}'}})
-               MATCH (u)-[:MEMBER_OF]->(g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource)
+               RETURN u.id, r.id
+               LIMIT 1
+               UNION
+               MATCH (u:User {id: $user_id})-[:MEMBER_OF]->(g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource {id: $resource_id})
                WHERE p.can_read = true
-               RETURN DISTINCT r.id, r.type, r.name""",
+               RETURN u.id, r.id
+               LIMIT 1""",
             params,
+            variant=True,
         )
 
-        # 6. Transitive group membership
-        params = [{"user_id": user} for user in random.choices(self.sample_users, k=30)]
-        self.benchmark_query(
-            "User's Groups (Direct Membership)",
-            """MATCH (u:User {{id: '{user_id}'}})-[:MEMBER_OF]->(g:UserGroup)
-               RETURN g.id, g.name""",
-            params,
+        # 3c. Same check behind a client-side filter of known grants
+        self.build_allow_filter()
+        self.benchmark_query_with_filter(
+            "Combined Permission Check (Filtered)", combined_check, params
         )
 
-        # 7. Reverse lookup: Who has access to a resource?
-        params = [
-            {"resource_id": resource}
-            for resource in random.choices(self.sample_resources, k=30)
-        ]
+        # 4. List all resources user can read
+        params = user_params[0:30]
         self.benchmark_query(
-            "Who Can Read Resource (Direct)",
-            """MATCH (u:User)-[p:HAS_PERMISSION_USER]->(r:Resource {{id: '{resource_id}'}})
+            "List User's Readable Resources",
+            """MATCH (u:User {id: $user_id})
+               MATCH (u)-[p:HAS_PERMISSION_USER]->(r:Resource)
                WHERE p.can_read = true
-               RETURN u.id, u.name""",
+               RETURN r.id, r.type, r.name""",
             params,
         )
 
-        # 8. Reverse lookup: Groups with access
-        params = [
-            {"resource_id": resource}
-            for resource in random.choices(self.sample_resources, k=30)
-        ]
-        self.benchmark_query(
-            "Which Groups Can Read Resource",
-            """MATCH (g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource {{id: '{resource_id}'}})
+        # 4b. Same lookup for the whole batch of users in one UNWIND execution
+        self.benchmark_batch_query(
+            "List User's Readable Resources (Batched)",
+            """UNWIND $user_ids AS uid
+               MATCH (u:User {id: uid})-[p:HAS_PERMISSION_USER]->(r:Resource)
                WHERE p.can_read = true
-               RETURN g.id, g.name""",
-            params,
+               RETURN uid, r.id""",
+            "user_ids",
+            [p["user_id"] for p in params],
         )
 
-        # 9. Check all permissions for a user on a resource
-        params = [
-            {"user_id": user, "resource_id": resource}
-            for user, resource in zip(
-                random.choices(self.sample_users, k=30),
-                random.choices(self.sample_resources, k=30),
-            )
+        # Independent lookups: run together on several connections when
+        # concurrency is enabled, otherwise one after another as above
+        jobs = [
+            # 5. List all resources user can read (including via groups)
+            (
+                "List User's Readable Resources (Via Groups)",
+                """MATCH (u:User {id: $user_id})
+                   MATCH (u)-[:MEMBER_OF]->(g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource)
+                   WHERE p.can_read = true
+                   RETURN DISTINCT r.id, r.type, r.name""",
+                user_params[30:60],
+            ),
+            # 6. Transitive group membership
+            (
+                "User's Groups (Direct Membership)",
+                """MATCH (u:User {id: $user_id})-[:MEMBER_OF]->(g:UserGroup)
+                   RETURN g.id, g.name""",
+                user_params[60:90],
+            ),
+            # 7. Reverse lookup: Who has access to a resource?
+            (
+                "Who Can Read Resource (Direct)",
+                """MATCH (u:User)-[p:HAS_PERMISSION_USER]->(r:Resource {id: $resource_id})
+                   WHERE p.can_read = true
+                   RETURN u.id, u.name""",
+                resource_params[0:30],
+            ),
+            # 8. Reverse lookup: Groups with access
+            (
+                "Which Groups Can Read Resource",
+                """MATCH (g:UserGroup)-[p:HAS_PERMISSION_GROUP]->(r:Resource {id: $resource_id})
+                   WHERE p.can_read = true
+                   RETURN g.id, g.name""",
+                resource_params[30:60],
+            ),
+            # 9. Check all permissions for a user on a resource
+            (
+                "Get All Permissions (User on Resource)",
+                """MATCH (u:User {id: $user_id})-[p:HAS_PERMISSION_USER]->(r:Resource {id: $resource_id})
+                   RETURN p.can_create, p.can_read, p.can_update, p.can_delete""",
+                ur_pairs[150:180],
+            ),
+            # 10. Count resources by permission type
+            (
+                "Count User's Resources by Permission",
+                """MATCH (u:User {id: $user_id})-[p:HAS_PERMISSION_USER]->(r:Resource)
+                   RETURN 
+                       sum(CASE WHEN p.can_create THEN 1 ELSE 0 END) as can_create_count,
+                       sum(CASE WHEN p.can_read THEN 1 ELSE 0 END) as can_read_count,
+                       sum(CASE WHEN p.can_update THEN 1 ELSE 0 END) as can_update_count,
+                       sum(CASE WHEN p.can_delete THEN 1 ELSE 0 END) as can_delete_count""",
+                user_params[90:110],
+            ),
         ]
-        self.benchmark_query(
-            "Get All Permissions (User on Resource)",
-            """MATCH (u:User {{id: '{user_id}'}})-[p:HAS_PERMISSION_USER]->(r:Resource {{id: '{resource_id}'}})
-               RETURN p.can_create, p.can_read, p.can_update, p.can_delete""",
-            params,
-        )
-
-        # 10. Count resources by permission type
-        params = [{"user_id": user} for user in random.choices(self.sample_users, k=20)]
-        self.benchmark_query(
-            "Count User's Resources by Permission",
-            """MATCH (u:User {{id: '{user_id}'}})-[p:HAS_PERMISSION_USER]->(r:Resource)
-               RETURN 
-                   sum(CASE WHEN p.can_create THEN 1 ELSE 0 END) as can_create_count,
-                   sum(CASE WHEN p.can_read THEN 1 ELSE 0 END) as can_read_count,
-                   sum(CASE WHEN p.can_update THEN 1 ELSE 0 END) as can_update_count,
-                   sum(CASE WHEN p.can_delete THEN 1 ELSE 0 END) as can_delete_count""",
-            params,
-        )
+        self.run_queries(jobs)
 
         self.save_results()
         self.print_summary()
+        self.print_variants()
 
     def save_results(self):
         """Save benchmark results to JSON."""
-        results_dir = Path(__file__).parent.parent.parent / "results"
+        results_dir = self.results_dir
         results_dir.mkdir(exist_ok=True)
-        output_file = results_dir / "query_benchmark_results.json"
+        # Concurrent runs measure latency under contention; keep them apart
+        # from the serial numbers the report compares across platforms
+        suffix = "_concurrent" if self.concurrency > 1 else ""
 
-        with open(output_file, "w") as f:
-            json.dump([r.to_dict() for r in self.results], f, indent=2)
+        outputs = [
+            (f"query_benchmark_results{suffix}.json", self.results),
+            (f"query_benchmark_variants{suffix}.json", self.variant_results),
+        ]
+        for name, results in outputs:
+            path = results_dir / name
+            path.write_bytes(
+                orjson.dumps([r.to_dict() for r in results], option=orjson.OPT_INDENT_2)
+            )
+            print(f"\n📊 Results saved to: {path}")
 
-        print(f"\n📊 Results saved to: {output_file}")
+        if self.concurrency < 2:
+            self.save_stats_cache()
+
+    def save_stats_cache(self):
+        """
+        Merge this run's p50/p95 into the per-benchmark stats cache.
+
+        Benchmarks that regressed keep their old baseline, so a slowdown is
+        reported again on the next run instead of becoming the new normal.
+        """
+        for r in self.results + self.variant_results:
+            key = self._stats_key(r.query_name, r.query)
+            if key in self._regressed:
+                continue
+            self.stats_cache[key] = {
+                "query_name": r.query_name,
+                "p50": r.p50_time_ms,
+                "p95": r.p95_time_ms,
+            }
+
+        self.stats_cache_file.write_bytes(
+            orjson.dumps(
+                self.stats_cache, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            )
+        )
 
     def print_summary(self):
         """Print summary comparison table."""
@@ -357,23 +760,66 @@ class AuthorizationBenchmark:
                 f"{result.p99_time_ms:<10.2f}"
             )
 
+        if not self.results:
+            return
+
         # Overall stats
-        all_avgs = [r.avg_time_ms for r in self.results]
-        all_p95s = [r.p95_time_ms for r in self.results]
+        n = len(self.results)
+        all_avgs = np.fromiter(
+            (r.avg_time_ms for r in self.results), dtype=np.float64, count=n
+        )
+        all_p95s = np.fromiter(
+            (r.p95_time_ms for r in self.results), dtype=np.float64, count=n
+        )
 
         print("-" * 75)
+        for label, reduce in (
+            ("Overall Average", np.mean),
+            ("Geometric Mean", lambda a: np.exp(np.log(a).mean())),
+            ("Std Deviation", np.std),
+        ):
+            print(
+                f"{label:<45} "
+                f"{reduce(all_avgs):<10.2f} "
+                f"{reduce(all_p95s):<10.2f} "
+                f"{'—':<10}"
+            )
+
+    def print_variants(self):
+        """Print the variant results, which the summary statistics leave out."""
+        if not self.variant_results:
+            return
+
         print(
-            f"{'Overall Average':<45} "
-            f"{statistics.mean(all_avgs):<10.2f} "
-            f"{statistics.mean(all_p95s):<10.2f} "
-            f"{'—':<10}"
+            f"\n{'Variant (saved separately)':<45} {'Avg (ms)':<10} {'p95 (ms)':<10} {'p99 (ms)':<10}"
         )
+        print("-" * 75)
+
+        for result in self.variant_results:
+            query_name = result.query_name[:44]
+            print(
+                f"{query_name:<45} "
+                f"{result.avg_time_ms:<10.2f} "
+                f"{result.p95_time_ms:<10.2f} "
+                f"{result.p99_time_ms:<10.2f}"
+            )
 
 
 def main():
     """Run query benchmarks on existing database."""
+    import argparse
     import sys
 
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--concurrent",
+        type=int,
+        default=0,
+        metavar="N",
+        help="run independent benchmarks on N connections at once",
+    )
+    args = parser.parse_args()
+
     base_dir = Path(__file__).parent.parent.parent
 
     # Use the CSV/COPY database by default
@@ -386,7 +832,7 @@ def main():
 
     print(f"Using database: {db_path}")
 
-    benchmark = AuthorizationBenchmark(db_path)
+    benchmark = AuthorizationBenchmark(db_path, concurrency=args.concurrent)
     benchmark.run_all_benchmarks()
 
 
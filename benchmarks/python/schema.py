@@ -31,9 +31,11 @@ def create_schema(db_path: str) -> kuzu.Database:
 
     print("Creating KuzuDB schema for authorization...")
 
-    # Create User node table
-    conn.execute(
-        """
+    statements = [
+        # User node table
+        (
+            "User node table",
+            """
         CREATE NODE TABLE User(
             id STRING,
             name STRING,
@@ -41,14 +43,12 @@ def create_schema(db_path: str) -> kuzu.Database:
             created_at TIMESTAMP,
             metadata STRING,
             PRIMARY KEY (id)
-        )
-    """
-    )
-    print("✓ Created User node table")
-
-    # Create Resource node table
-    conn.execute(
-        """
+        )""",
+        ),
+        # Resource node table
+        (
+            "Resource node table",
+            """
         CREATE NODE TABLE Resource(
             id STRING,
             type STRING,
@@ -57,14 +57,12 @@ def create_schema(db_path: str) -> kuzu.Database:
             created_at TIMESTAMP,
             metadata STRING,
             PRIMARY KEY (id)
-        )
-    """
-    )
-    print("✓ Created Resource node table")
-
-    # Create UserGroup node table
-    conn.execute(
-        """
+        )""",
+        ),
+        # UserGroup node table
+        (
+            "UserGroup node table",
+            """
         CREATE NODE TABLE UserGroup(
             id STRING,
             name STRING,
@@ -72,27 +70,23 @@ def create_schema(db_path: str) -> kuzu.Database:
             created_at TIMESTAMP,
             metadata STRING,
             PRIMARY KEY (id)
-        )
-    """
-    )
-    print("✓ Created UserGroup node table")
-
-    # Create MEMBER_OF relationship (User -> UserGroup)
-    conn.execute(
-        """
+        )""",
+        ),
+        # MEMBER_OF relationship (User -> UserGroup)
+        (
+            "MEMBER_OF relationship table",
+            """
         CREATE REL TABLE MEMBER_OF(
             FROM User TO UserGroup,
             joined_at TIMESTAMP,
             role STRING
-        )
-    """
-    )
-    print("✓ Created MEMBER_OF relationship table")
-
-    # Create HAS_PERMISSION relationship (User -> Resource, Group -> Resource)
-    # Permissions: create, read, update, delete (CRUD)
-    conn.execute(
-        """
+        )""",
+        ),
+        # HAS_PERMISSION relationship (User -> Resource, Group -> Resource)
+        # Permissions: create, read, update, delete (CRUD)
+        (
+            "HAS_PERMISSION_USER relationship table",
+            """
         CREATE REL TABLE HAS_PERMISSION_USER(
             FROM User TO Resource,
             can_create BOOLEAN,
@@ -101,13 +95,11 @@ def create_schema(db_path: str) -> kuzu.Database:
             can_delete BOOLEAN,
             granted_at TIMESTAMP,
             granted_by STRING
-        )
-    """
-    )
-    print("✓ Created HAS_PERMISSION_USER relationship table")
-
-    conn.execute(
-        """
+        )""",
+        ),
+        (
+            "HAS_PERMISSION_GROUP relationship table",
+            """
         CREATE REL TABLE HAS_PERMISSION_GROUP(
             FROM UserGroup TO Resource,
             can_create BOOLEAN,
@@ -116,22 +108,24 @@ def create_schema(db_path: str) -> kuzu.Database:
             can_delete BOOLEAN,
             granted_at TIMESTAMP,
             granted_by STRING
-        )
-    """
-    )
-    print("✓ Created HAS_PERMISSION_GROUP relationship table")
-
-    # Create INHERITS_FROM relationship (UserGroup -> UserGroup)
-    # For nested group hierarchies
-    conn.execute(
-        """
+        )""",
+        ),
+        # INHERITS_FROM relationship (UserGroup -> UserGroup)
+        # For nested group hierarchies
+        (
+            "INHERITS_FROM relationship table",
+            """
         CREATE REL TABLE INHERITS_FROM(
             FROM UserGroup TO UserGroup,
             created_at TIMESTAMP
-        )
-    """
-    )
-    print("✓ Created INHERITS_FROM relationship table")
+        )""",
+        ),
+    ]
+
+    # Submit all DDL as one multi-statement call instead of seven round trips
+    conn.execute(";\n".join(ddl for _, ddl in statements))
+    for label, _ in statements:
+        print(f"✓ Created {label}")
 
     print("\n✅ Schema created successfully!")
 
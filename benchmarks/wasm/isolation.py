@@ -0,0 +1,34 @@
+"""
+Cross-origin isolation headers shared by the WASM benchmark servers.
+
+The multi-threaded Kuzu WASM build needs SharedArrayBuffer, which browsers
+only enable on cross-origin isolated pages.
+"""
+
+ISOLATION_HEADERS = {
+    "Cross-Origin-Opener-Policy": "same-origin",
+    "Cross-Origin-Embedder-Policy": "require-corp",
+    "Cross-Origin-Resource-Policy": "cross-origin",
+}
+
+
+class IsolationHeadersMiddleware:
+    """ASGI middleware adding the COOP/COEP headers to every HTTP response."""
+
+    def __init__(self, app):
+        self.app = app
+        self.headers = [
+            (name.lower().encode(), value.encode())
+            for name, value in ISOLATION_HEADERS.items()
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + self.headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
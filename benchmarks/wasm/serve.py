@@ -3,15 +3,32 @@
 HTTP server with COOP/COEP headers for WASM with SharedArrayBuffer support
 """
 import http.server
+import io
+import os
 import socketserver
 from functools import partial
 
+from isolation import ISOLATION_HEADERS, IsolationHeadersMiddleware
+
+try:
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.routing import Mount
+    from starlette.staticfiles import StaticFiles
+except ImportError:  # uvicorn/starlette are optional; http.server is used instead
+    uvicorn = None
+
 
 class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Buffer headers so they go out in one write before the file body
+    wbufsize = -1
+
     def end_headers(self):
         # Required headers for SharedArrayBuffer
-        self.send_header("Cross-Origin-Opener-Policy", "same-origin")
-        self.send_header("Cross-Origin-Embedder-Policy", "require-corp")
+        for name, value in ISOLATION_HEADERS.items():
+            self.send_header(name, value)
         # CORS headers for development
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
@@ -22,15 +39,53 @@ class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_response(200)
         self.end_headers()
 
+    def copyfile(self, source, outputfile):
+        # Zero-copy sendfile for the multi-MB WASM binaries when both ends are fds
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            in_fd = out_fd = None
+        if in_fd is None or not hasattr(os, "sendfile"):
+            return super().copyfile(source, outputfile)
+
+        outputfile.flush()
+        offset = source.tell()
+        remaining = os.fstat(in_fd).st_size - offset
+        while remaining > 0:
+            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
 
 PORT = 8080
 
-with socketserver.TCPServer(("", PORT), CORSRequestHandler) as httpd:
-    print(f"🚀 Server running at http://localhost:{PORT}")
-    print(f"📦 WASM benchmarks: http://localhost:{PORT}/benchmarks/wasm/")
-    print("✅ COOP/COEP headers enabled for SharedArrayBuffer support")
-    print("\nPress Ctrl+C to stop the server")
-    try:
-        httpd.serve_forever()
-    except KeyboardInterrupt:
-        print("\n\n👋 Server stopped")
+print(f"🚀 Server running at http://localhost:{PORT}")
+print(f"📦 WASM benchmarks: http://localhost:{PORT}/benchmarks/wasm/")
+print("✅ COOP/COEP headers enabled for SharedArrayBuffer support")
+print("\nPress Ctrl+C to stop the server")
+
+if uvicorn is not None:
+    app = Starlette(
+        routes=[Mount("/", StaticFiles(directory=os.getcwd(), html=True))],
+        middleware=[
+            Middleware(IsolationHeadersMiddleware),
+            Middleware(
+                CORSMiddleware,
+                allow_origins=["*"],
+                allow_methods=["GET", "POST", "OPTIONS"],
+                allow_headers=["*"],
+            ),
+        ],
+    )
+    # Picks up httptools/uvloop automatically when they are installed
+    uvicorn.run(app, host="0.0.0.0", port=PORT, log_level="warning")
+    print("\n\n👋 Server stopped")
+else:
+    with socketserver.TCPServer(("", PORT), CORSRequestHandler) as httpd:
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n\n👋 Server stopped")
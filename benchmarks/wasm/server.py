@@ -5,19 +5,72 @@ Simple HTTP server for WASM benchmarks with POST endpoint to save results.
 
 import json
 import os
+import queue
+import threading
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+from isolation import ISOLATION_HEADERS, IsolationHeadersMiddleware
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json writes the same output
+    orjson = None
+
+try:
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.responses import JSONResponse
+    from starlette.routing import Mount, Route
+    from starlette.staticfiles import StaticFiles
+except ImportError:  # uvicorn/starlette are optional; http.server is used instead
+    uvicorn = None
+
+# Result files are written by one background thread so POST handlers can
+# respond as soon as the payload has been parsed. None stops the writer.
+_write_q = queue.Queue()
+
+
+def _writer_loop():
+    """Write queued (path, results) pairs to disk until told to stop."""
+    while True:
+        item = _write_q.get()
+        try:
+            if item is None:
+                return
+            filepath, results = item
+            if orjson is not None:
+                with open(filepath, "wb") as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, "w") as f:
+                    json.dump(results, f, indent=2)
+            print(f"✅ Saved benchmark results to: {filepath}")
+        except Exception as e:
+            print(f"❌ Error saving results: {e}")
+        finally:
+            _write_q.task_done()
+
+
+def _results_path() -> Path:
+    """Return a timestamped path in the results directory for one upload."""
+    results_dir = Path(__file__).parent.parent.parent / "results"
+    results_dir.mkdir(exist_ok=True)
+
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return results_dir / f"kuzu-wasm-benchmark-{timestamp}.json"
+
 
 class BenchmarkServerHandler(SimpleHTTPRequestHandler):
     """HTTP handler that serves files and accepts POST requests to save results."""
 
     def end_headers(self):
         """Add COOP/COEP headers to enable SharedArrayBuffer for WASM."""
-        self.send_header("Cross-Origin-Opener-Policy", "same-origin")
-        self.send_header("Cross-Origin-Embedder-Policy", "require-corp")
-        self.send_header("Cross-Origin-Resource-Policy", "cross-origin")
+        for name, value in ISOLATION_HEADERS.items():
+            self.send_header(name, value)
         super().end_headers()
 
     def do_GET(self):
@@ -28,21 +81,15 @@ class BenchmarkServerHandler(SimpleHTTPRequestHandler):
         """Handle POST requests to save benchmark results."""
         if self.path == "/save-results":
             try:
-                # Read the request body
                 content_length = int(self.headers["Content-Length"])
                 post_data = self.rfile.read(content_length)
                 results = json.loads(post_data.decode("utf-8"))
 
                 # Save to results directory
-                results_dir = Path(__file__).parent.parent.parent / "results"
-                results_dir.mkdir(exist_ok=True)
+                filepath = _results_path()
+                filename = filepath.name
 
-                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                filename = f"kuzu-wasm-benchmark-{timestamp}.json"
-                filepath = results_dir / filename
-
-                with open(filepath, "w") as f:
-                    json.dump(results, f, indent=2)
+                _write_q.put((filepath, results))
 
                 # Send success response
                 self.send_response(200)
@@ -52,8 +99,6 @@ class BenchmarkServerHandler(SimpleHTTPRequestHandler):
                 response = {"success": True, "file": str(filename)}
                 self.wfile.write(json.dumps(response).encode())
 
-                print(f"✅ Saved benchmark results to: {filepath}")
-
             except Exception as e:
                 self.send_response(500)
                 self.send_header("Content-Type", "application/json")
@@ -74,25 +119,71 @@ class BenchmarkServerHandler(SimpleHTTPRequestHandler):
         self.end_headers()
 
 
+async def _save_results(request):
+    """Accept a results upload and hand it to the background writer."""
+    try:
+        results = await request.json()
+        filepath = _results_path()
+        _write_q.put((filepath, results))
+        return JSONResponse({"success": True, "file": filepath.name})
+    except Exception as e:
+        print(f"❌ Error saving results: {e}")
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+
+def create_app(project_root: Path):
+    """Build the ASGI app: the results endpoint plus static project files."""
+    return Starlette(
+        routes=[
+            Route("/save-results", _save_results, methods=["POST"]),
+            Mount("/", StaticFiles(directory=project_root, html=True)),
+        ],
+        middleware=[
+            Middleware(IsolationHeadersMiddleware),
+            Middleware(
+                CORSMiddleware,
+                allow_origins=["*"],
+                allow_methods=["POST", "GET", "OPTIONS"],
+                allow_headers=["Content-Type"],
+            ),
+        ],
+    )
+
+
 def run_server(port=8080):
     """Run the server."""
     # Change to project root so paths work correctly
     project_root = Path(__file__).parent.parent.parent
     os.chdir(project_root)
 
-    server_address = ("", port)
-    httpd = HTTPServer(server_address, BenchmarkServerHandler)
-
     print(f"🚀 WASM Benchmark Server running on http://localhost:{port}")
     print(f"📂 Serving files from: {project_root}")
     print(f"💾 Results will be saved to: {project_root / 'results'}")
     print(f"\n🌐 Open: http://localhost:{port}/benchmarks/wasm/")
     print("\nPress Ctrl+C to stop the server")
 
+    writer = threading.Thread(target=_writer_loop, daemon=True)
+    writer.start()
+
     try:
-        httpd.serve_forever()
+        if uvicorn is not None:
+            # Picks up httptools/uvloop automatically when they are installed
+            uvicorn.run(
+                create_app(project_root),
+                host="0.0.0.0",
+                port=port,
+                log_level="warning",
+            )
+        else:
+            # Threaded so static assets keep loading while results are uploaded
+            httpd = ThreadingHTTPServer(("", port), BenchmarkServerHandler)
+            httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n\n👋 Server stopped")
+    finally:
+        # Flush results that are still queued before exiting
+        _write_q.put(None)
+        writer.join()
 
 
 if __name__ == "__main__":
@@ -12,18 +12,36 @@ Exports data in multiple formats: CSV, Parquet, JSON
 
 import csv
 import json
-import random
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 
-import pandas as pd
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 from faker import Faker
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; _sample_targets then runs as plain Python
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+    prange = range
+
+
 # Initialize Faker for realistic data
 fake = Faker()
 Faker.seed(42)
-random.seed(42)
+rng = np.random.default_rng(42)
+
+# Timestamps are datetime64[us] arrays drawn from the last two years
+NOW = np.datetime64(datetime.now(), "us")
+TWO_YEARS_AGO = NOW - np.timedelta64(2 * 365, "D")
 
 # Configuration
 NUM_USERS = 5000
@@ -33,287 +51,504 @@ AVG_MEMBERSHIPS_PER_USER = 2  # Users per group
 AVG_USER_PERMISSIONS_PER_RESOURCE = 2
 AVG_GROUP_PERMISSIONS_PER_RESOURCE = 1.5
 AVG_GROUP_HIERARCHY_DEPTH = 0.3  # 30% of groups inherit from another
+PARQUET_ROW_GROUP_SIZE = 8192  # Rows converted to Arrow and written at a time
 
 RESOURCE_TYPES = ["document", "folder", "project", "api_key", "database"]
 
+# Parquet column types that cannot be read off the numpy dtype. The
+# low-cardinality string columns are dictionary-encoded.
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+COLUMN_TYPES = {
+    "type": CATEGORY,
+    "role": CATEGORY,
+}
 
-def generate_users(num_users: int) -> List[Dict]:
-    """Generate user nodes."""
-    print(f"Generating {num_users} users...")
-    users = []
-
-    for i in range(num_users):
-        user_id = f"user_{i:06d}"
-        created_at = fake.date_time_between(start_date="-2y", end_date="now")
-
-        users.append(
-            {
-                "id": user_id,
-                "name": fake.name(),
-                "email": fake.email(),
-                "created_at": created_at.isoformat(),
-                "metadata": json.dumps(
-                    {"department": fake.job(), "location": fake.city()}
-                ),
-            }
+
+def faker_pool(method: Callable[[], str], size: int = 2000) -> np.ndarray:
+    """Call a Faker method size times and keep the values as an object array."""
+    return np.array([method() for _ in range(size)], dtype=object)
+
+
+# Faker values are drawn once into pools; the generators sample from them with
+# numpy instead of going through Faker's provider dispatch for every row
+NAME_POOL = faker_pool(fake.name)
+EMAIL_DOMAIN_POOL = faker_pool(fake.free_email_domain, 50)
+JOB_POOL = faker_pool(fake.job)
+CITY_POOL = faker_pool(fake.city)
+WORD_POOL = faker_pool(fake.word)
+FILE_NAME_POOL = faker_pool(lambda: fake.file_name(extension="pdf"))
+COMPANY_POOL = faker_pool(fake.company, 500)
+CATCH_PHRASE_POOL = faker_pool(fake.catch_phrase)
+BS_POOL = faker_pool(fake.bs)
+
+
+# Tables are column-oriented: one list or numpy array per column, all of the
+# same length. A nested table (field name -> values) is a struct column such
+# as metadata.
+Table = Dict[str, List]
+
+
+def num_rows(table: Table) -> int:
+    """Return the number of rows in a column-oriented table."""
+    return len(next(iter(table.values()), []))
+
+
+def slice_rows(table: Table, start: int, stop: int) -> Table:
+    """Return rows start:stop of every column, struct columns included."""
+    return {
+        name: (
+            slice_rows(column, start, stop)
+            if isinstance(column, dict)
+            else column[start:stop]
         )
+        for name, column in table.items()
+    }
+
+
+def pick(pool: np.ndarray, size: int) -> np.ndarray:
+    """Draw size values from a pool, with replacement."""
+    return pool[rng.integers(0, len(pool), size=size)]
+
+
+def random_timestamps(low, size=None) -> np.ndarray:
+    """
+    Draw uniform timestamps between low and NOW.
+
+    Args:
+        low: Lower bound, either one datetime64 or an array of them
+        size: Number of draws when low is a single value
+    """
+    low = np.asarray(low, dtype="datetime64[us]").astype(np.int64)
+    high = NOW.astype(np.int64)
+    return rng.integers(low, high, size=size).astype("datetime64[us]")
+
+
+def random_flags(size: int, probabilities: List[float]) -> np.ndarray:
+    """
+    Draw one boolean column per probability, each True with that probability.
+
+    Returns:
+        Array of shape (len(probabilities), size), one contiguous row per column
+    """
+    thresholds = np.asarray(probabilities, dtype=np.float32)[:, None]
+    return rng.random((len(probabilities), size), dtype=np.float32) < thresholds
+
+
+def export_columns(data: Table) -> Table:
+    """
+    Return the table with numpy columns converted to plain Python lists.
+
+    Timestamp columns become ISO-8601 strings and struct columns JSON strings
+    on the way.
+    """
+    exported = {}
+    for name, column in data.items():
+        if isinstance(column, dict):
+            column = json_strings(column)
+        elif isinstance(column, np.ndarray):
+            column = iso_strings(column).tolist()
+        exported[name] = column
+    return exported
+
+
+def arrow_type(name: str, column) -> pa.DataType:
+    """
+    Return the Arrow type a column is written to Parquet with.
+
+    Struct columns are written as JSON strings, the same text the CSV and
+    JSON exports hold, since every loader declares metadata as STRING.
+    """
+    if name in COLUMN_TYPES:
+        return COLUMN_TYPES[name]
+    if isinstance(column, np.ndarray):
+        if np.issubdtype(column.dtype, np.datetime64):
+            return pa.timestamp("us")
+        if column.dtype == np.bool_:
+            return pa.bool_()
+    return pa.string()
+
+
+def arrow_schema(data: Table) -> pa.Schema:
+    """Build an explicit Arrow schema for a table."""
+    return pa.schema(
+        [pa.field(name, arrow_type(name, column)) for name, column in data.items()]
+    )
+
 
-    print(f"  ✓ Generated {len(users)} users")
+def to_arrow(data: Table, schema: pa.Schema) -> pa.Table:
+    """Build an Arrow table from the columns with the types in schema."""
+
+    def to_array(column, type):
+        if isinstance(column, dict):
+            column = json_strings(column)
+        return pa.array(column, type=type)
+
+    return pa.table(
+        [to_array(data[field.name], field.type) for field in schema], schema=schema
+    )
+
+
+def json_strings(struct: Table) -> List[str]:
+    """
+    Encode each row of a struct column as a JSON object string.
+
+    Every row has the same keys, so the objects are assembled column by
+    column from the encoded field values instead of dumping a dict per row.
+    """
+    rows = None
+    for field, column in struct.items():
+        pair = f"{json.dumps(field)}: " + json_values(column)
+        rows = pair if rows is None else rows + ", " + pair
+    return ("{" + rows + "}").tolist()
+
+
+def json_values(column) -> np.ndarray:
+    """JSON-encode a column into an object array, each distinct value once."""
+    if isinstance(column, np.ndarray) and column.ndim == 1:
+        values, inverse = np.unique(column, return_inverse=True)
+        encoded = [json.dumps(value) for value in values.tolist()]
+        return np.array(encoded, dtype=object)[inverse]
+    return np.array([json.dumps(value) for value in column], dtype=object)
+
+
+def iso_strings(column: np.ndarray) -> np.ndarray:
+    """Format a datetime64 column as ISO-8601 strings; other columns pass through."""
+    if np.issubdtype(column.dtype, np.datetime64):
+        return np.datetime_as_string(column, unit="us")
+    return column
+
+
+@njit(parallel=True, cache=True)
+def _sample_targets(counts: np.ndarray, num_targets: int, draws: np.ndarray):
+    """
+    Pick counts[i] distinct target rows for every source row i.
+
+    Uses Floyd's algorithm. The m-th of a source's k picks arrives pre-drawn
+    in [0, num_targets - k + m], so each source reads its own slice of draws
+    and the result does not depend on thread scheduling.
+    """
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    targets = np.empty(offsets[-1], dtype=np.int64)
+
+    for i in prange(len(counts)):
+        start = offsets[i]
+        k = counts[i]
+        for m in range(k):
+            j = num_targets - k + m
+            t = draws[start + m]
+            for prev in range(start, start + m):
+                if targets[prev] == t:
+                    t = j
+                    break
+            targets[start + m] = t
+
+    return targets
+
+
+def assemble_edges(
+    num_sources: int, num_targets: int, min_edges: int, max_edges: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Connect every source row to between min_edges and max_edges distinct targets.
+
+    Returns:
+        Parallel (source_idx, target_idx) arrays of row indices
+    """
+    counts = rng.integers(min_edges, min(max_edges, num_targets) + 1, size=num_sources)
+
+    # Exclusive upper bound of every Floyd pick: num_targets - k + m + 1 for
+    # the m-th of k picks, so the draws are exact integers without rejection
+    sources = np.repeat(np.arange(num_sources), counts)
+    starts = np.cumsum(counts) - counts
+    rank = np.arange(len(sources)) - starts[sources]
+    draws = rng.integers(0, num_targets - counts[sources] + rank + 1)
+
+    return sources, _sample_targets(counts, num_targets, draws)
+
+
+def generate_users(num_users: int, created_at: np.ndarray) -> Table:
+    """Generate user nodes, one per created_at timestamp."""
+    print(f"Generating {num_users} users...")
+
+    ids = np.char.mod("user_%06d", np.arange(num_users)).astype(object)
+    users = {
+        "id": ids,
+        "name": pick(NAME_POOL, num_users),
+        # Derived from the id so every email is unique, unlike a pool draw
+        "email": ids + "@" + pick(EMAIL_DOMAIN_POOL, num_users),
+        "created_at": created_at,
+        "metadata": {
+            "department": pick(JOB_POOL, num_users),
+            "location": pick(CITY_POOL, num_users),
+        },
+    }
+
+    print(f"  ✓ Generated {num_rows(users)} users")
     return users
 
 
-def generate_resources(num_resources: int) -> List[Dict]:
-    """Generate resource nodes."""
+def generate_resources(num_resources: int, created_at: np.ndarray) -> Table:
+    """Generate resource nodes, one per created_at timestamp."""
     print(f"Generating {num_resources} resources...")
-    resources = []
 
-    for i in range(num_resources):
-        resource_id = f"resource_{i:06d}"
-        resource_type = random.choice(RESOURCE_TYPES)
-        created_at = fake.date_time_between(start_date="-2y", end_date="now")
+    type_codes = rng.integers(0, len(RESOURCE_TYPES), size=num_resources)
+    types = np.array(RESOURCE_TYPES, dtype=object)[type_codes]
 
-        # Generate type-specific names
+    # Generate type-specific names
+    names = np.empty(num_resources, dtype=object)
+    for code, resource_type in enumerate(RESOURCE_TYPES):
+        rows = type_codes == code
+        n = int(rows.sum())
         if resource_type == "document":
-            name = f"{fake.word().capitalize()} {fake.file_name(extension='pdf')}"
+            titles = np.char.capitalize(pick(WORD_POOL, n).astype(str)).astype(object)
+            names[rows] = titles + " " + pick(FILE_NAME_POOL, n)
         elif resource_type == "folder":
-            name = f"/{fake.word()}/{fake.word()}"
+            names[rows] = "/" + pick(WORD_POOL, n) + "/" + pick(WORD_POOL, n)
         elif resource_type == "project":
-            name = f"{fake.company()} - {fake.catch_phrase()}"
+            names[rows] = pick(COMPANY_POOL, n) + " - " + pick(CATCH_PHRASE_POOL, n)
         elif resource_type == "api_key":
-            name = f"API Key - {fake.word()}"
+            names[rows] = "API Key - " + pick(WORD_POOL, n)
         else:  # database
-            name = f"db_{fake.word()}_{random.randint(1,100)}"
-
-        resources.append(
-            {
-                "id": resource_id,
-                "type": resource_type,
-                "name": name,
-                "owner_id": f"user_{random.randint(0, min(100, num_resources-1)):06d}",
-                "created_at": created_at.isoformat(),
-                "metadata": json.dumps({"tags": [fake.word(), fake.word()]}),
-            }
-        )
+            suffixes = np.char.mod("_%d", rng.integers(1, 101, size=n)).astype(object)
+            names[rows] = "db_" + pick(WORD_POOL, n) + suffixes
+
+    owners = rng.integers(0, min(100, num_resources - 1) + 1, size=num_resources)
+    tags = np.stack(
+        [pick(WORD_POOL, num_resources), pick(WORD_POOL, num_resources)], axis=1
+    )
+
+    resources = {
+        "id": np.char.mod("resource_%06d", np.arange(num_resources)),
+        "type": types,
+        "name": names,
+        "owner_id": np.char.mod("user_%06d", owners),
+        "created_at": created_at,
+        "metadata": {"tags": tags.tolist()},
+    }
 
-    print(f"  ✓ Generated {len(resources)} resources")
+    print(f"  ✓ Generated {num_rows(resources)} resources")
     return resources
 
 
-def generate_groups(num_groups: int) -> List[Dict]:
-    """Generate group nodes."""
+def generate_groups(num_groups: int, created_at: np.ndarray) -> Table:
+    """Generate group nodes, one per created_at timestamp."""
     print(f"Generating {num_groups} groups...")
-    groups = []
-
     departments = ["Engineering", "Sales", "Marketing", "HR", "Finance", "Operations"]
     teams = ["Alpha", "Beta", "Gamma", "Delta", "Core", "Platform", "Infrastructure"]
 
-    for i in range(num_groups):
-        group_id = f"group_{i:04d}"
-        created_at = fake.date_time_between(start_date="-2y", end_date="now")
-
-        # Create hierarchical group names
-        if random.random() < 0.3:
-            name = f"{random.choice(departments)} - {random.choice(teams)}"
-        else:
-            name = f"{random.choice(departments)}"
-
-        groups.append(
-            {
-                "id": group_id,
-                "name": name,
-                "description": fake.bs(),
-                "created_at": created_at.isoformat(),
-                "metadata": json.dumps({"level": random.randint(1, 5)}),
-            }
-        )
+    # Create hierarchical group names
+    names = pick(np.array(departments, dtype=object), num_groups)
+    with_team = rng.random(num_groups) < 0.3
+    names[with_team] += " - " + pick(np.array(teams, dtype=object), with_team.sum())
 
-    print(f"  ✓ Generated {len(groups)} groups")
+    groups = {
+        "id": np.char.mod("group_%04d", np.arange(num_groups)),
+        "name": names,
+        "description": pick(BS_POOL, num_groups),
+        "created_at": created_at,
+        "metadata": {"level": rng.integers(1, 6, size=num_groups)},
+    }
+
+    print(f"  ✓ Generated {num_rows(groups)} groups")
     return groups
 
 
-def generate_member_of_edges(users: List[Dict], groups: List[Dict]) -> List[Dict]:
+def generate_member_of_edges(users: Table, groups: Table) -> Table:
     """Generate MEMBER_OF edges (User -> Group)."""
     print(f"Generating user memberships...")
-    edges = []
 
     # Each user joins 1-4 groups
-    for user in users:
-        num_memberships = random.randint(1, min(4, len(groups)))
-        selected_groups = random.sample(groups, num_memberships)
-
-        for group in selected_groups:
-            joined_at = fake.date_time_between(
-                start_date=max(
-                    datetime.fromisoformat(user["created_at"]),
-                    datetime.fromisoformat(group["created_at"]),
-                ),
-                end_date="now",
-            )
-
-            edges.append(
-                {
-                    "from": user["id"],
-                    "to": group["id"],
-                    "joined_at": joined_at.isoformat(),
-                    "role": random.choice(["member", "member", "member", "admin"]),
-                }
-            )
-
-    print(f"  ✓ Generated {len(edges)} memberships")
+    from_idx, to_idx = assemble_edges(num_rows(users), num_rows(groups), 1, 4)
+
+    edges = {
+        "from": users["id"][from_idx],
+        "to": groups["id"][to_idx],
+        # Joined after both the user and the group were created
+        "joined_at": random_timestamps(
+            np.maximum(users["created_at"][from_idx], groups["created_at"][to_idx])
+        ),
+        "role": pick(
+            np.array(["member", "member", "member", "admin"], dtype=object),
+            len(from_idx),
+        ),
+    }
+
+    print(f"  ✓ Generated {num_rows(edges)} memberships")
     return edges
 
 
-def generate_user_permission_edges(
-    users: List[Dict], resources: List[Dict]
-) -> List[Dict]:
+def generate_user_permission_edges(users: Table, resources: Table) -> Table:
     """Generate HAS_PERMISSION edges (User -> Resource)."""
     print(f"Generating user permissions...")
-    edges = []
 
     # Each resource gets permissions for a few users
-    for resource in resources:
-        num_permissions = random.randint(1, 5)
-        selected_users = random.sample(users, num_permissions)
-
-        for user in selected_users:
-            granted_at = fake.date_time_between(
-                start_date=max(
-                    datetime.fromisoformat(user["created_at"]),
-                    datetime.fromisoformat(resource["created_at"]),
-                ),
-                end_date="now",
-            )
-
-            # Random CRUD permissions
-            # Owner gets full permissions, others get varied access
-            is_owner = user["id"] == resource["owner_id"]
-
-            edges.append(
-                {
-                    "from": user["id"],
-                    "to": resource["id"],
-                    "can_create": is_owner or random.random() < 0.3,
-                    "can_read": is_owner or random.random() < 0.9,
-                    "can_update": is_owner or random.random() < 0.5,
-                    "can_delete": is_owner or random.random() < 0.2,
-                    "granted_at": granted_at.isoformat(),
-                    "granted_by": resource["owner_id"],
-                }
-            )
-
-    print(f"  ✓ Generated {len(edges)} user permissions")
+    to_idx, from_idx = assemble_edges(num_rows(resources), num_rows(users), 1, 5)
+    user_ids = users["id"][from_idx]
+    owner_ids = resources["owner_id"][to_idx]
+
+    # Random CRUD permissions
+    # Owner gets full permissions, others get varied access
+    can_create, can_read, can_update, can_delete = random_flags(
+        len(from_idx), [0.3, 0.9, 0.5, 0.2]
+    ) | (user_ids == owner_ids)
+
+    edges = {
+        "from": user_ids,
+        "to": resources["id"][to_idx],
+        "can_create": can_create,
+        "can_read": can_read,
+        "can_update": can_update,
+        "can_delete": can_delete,
+        # Granted after both the user and the resource were created
+        "granted_at": random_timestamps(
+            np.maximum(users["created_at"][from_idx], resources["created_at"][to_idx])
+        ),
+        "granted_by": owner_ids,
+    }
+
+    print(f"  ✓ Generated {num_rows(edges)} user permissions")
     return edges
 
 
-def generate_group_permission_edges(
-    groups: List[Dict], resources: List[Dict]
-) -> List[Dict]:
+def generate_group_permission_edges(groups: Table, resources: Table) -> Table:
     """Generate HAS_PERMISSION edges (Group -> Resource)."""
     print(f"Generating group permissions...")
-    edges = []
 
     # Each resource gets permissions for a few groups
-    for resource in resources:
-        num_permissions = random.randint(0, 3)
-        if num_permissions > 0:
-            selected_groups = random.sample(groups, num_permissions)
-
-            for group in selected_groups:
-                granted_at = fake.date_time_between(
-                    start_date=max(
-                        datetime.fromisoformat(group["created_at"]),
-                        datetime.fromisoformat(resource["created_at"]),
-                    ),
-                    end_date="now",
-                )
-
-                # Groups typically get broader permissions
-                edges.append(
-                    {
-                        "from": group["id"],
-                        "to": resource["id"],
-                        "can_create": random.random() < 0.4,
-                        "can_read": random.random() < 0.95,
-                        "can_update": random.random() < 0.6,
-                        "can_delete": random.random() < 0.3,
-                        "granted_at": granted_at.isoformat(),
-                        "granted_by": resource["owner_id"],
-                    }
-                )
-
-    print(f"  ✓ Generated {len(edges)} group permissions")
+    to_idx, from_idx = assemble_edges(num_rows(resources), num_rows(groups), 0, 3)
+
+    # Groups typically get broader permissions
+    can_create, can_read, can_update, can_delete = random_flags(
+        len(from_idx), [0.4, 0.95, 0.6, 0.3]
+    )
+
+    edges = {
+        "from": groups["id"][from_idx],
+        "to": resources["id"][to_idx],
+        "can_create": can_create,
+        "can_read": can_read,
+        "can_update": can_update,
+        "can_delete": can_delete,
+        # Granted after both the group and the resource were created
+        "granted_at": random_timestamps(
+            np.maximum(groups["created_at"][from_idx], resources["created_at"][to_idx])
+        ),
+        "granted_by": resources["owner_id"][to_idx],
+    }
+
+    print(f"  ✓ Generated {num_rows(edges)} group permissions")
     return edges
 
 
-def generate_inherits_from_edges(groups: List[Dict]) -> List[Dict]:
+def generate_inherits_from_edges(groups: Table) -> Table:
     """Generate INHERITS_FROM edges (Group -> Group) for hierarchies."""
     print(f"Generating group hierarchies...")
-    edges = []
-
-    # Create parent-child relationships (avoid cycles)
-    potential_parents = groups[: len(groups) // 2]  # First half can be parents
-    potential_children = groups[len(groups) // 2 :]  # Second half can be children
-
-    for child_group in potential_children:
-        if random.random() < AVG_GROUP_HIERARCHY_DEPTH:
-            parent_group = random.choice(potential_parents)
-            created_at = fake.date_time_between(
-                start_date=max(
-                    datetime.fromisoformat(child_group["created_at"]),
-                    datetime.fromisoformat(parent_group["created_at"]),
-                ),
-                end_date="now",
-            )
 
-            edges.append(
-                {
-                    "from": child_group["id"],
-                    "to": parent_group["id"],
-                    "created_at": created_at.isoformat(),
-                }
-            )
-
-    print(f"  ✓ Generated {len(edges)} group hierarchies")
+    # Create parent-child relationships (avoid cycles): the first half of the
+    # groups can be parents, the second half children
+    num_groups = num_rows(groups)
+    num_parents = num_groups // 2
+    children = np.arange(num_parents, num_groups)
+
+    from_idx = children[rng.random(len(children)) < AVG_GROUP_HIERARCHY_DEPTH]
+    to_idx = rng.integers(0, num_parents, size=len(from_idx))
+
+    edges = {
+        "from": groups["id"][from_idx],
+        "to": groups["id"][to_idx],
+        # Created after both groups existed
+        "created_at": random_timestamps(
+            np.maximum(groups["created_at"][from_idx], groups["created_at"][to_idx])
+        ),
+    }
+
+    print(f"  ✓ Generated {num_rows(edges)} group hierarchies")
     return edges
 
 
-def save_to_csv(data: List[Dict], filepath: Path):
+def save_to_csv(data: Table, filepath: Path):
     """Save data to CSV format."""
-    if not data:
+    if not num_rows(data):
         return
 
+    # Minimal quoting and True/False booleans, as the TypeScript loaders
+    # that split lines on commas expect
+    data = export_columns(data)
     with open(filepath, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=data[0].keys())
-        writer.writeheader()
-        writer.writerows(data)
+        writer = csv.writer(f)
+        writer.writerow(data.keys())
+        writer.writerows(zip(*data.values()))
 
     print(f"  ✓ Saved CSV: {filepath.name}")
 
 
-def save_to_parquet(data: List[Dict], filepath: Path):
+def save_to_parquet(data: Table, filepath: Path):
     """Save data to Parquet format."""
-    if not data:
+    if not num_rows(data):
         return
 
-    df = pd.DataFrame(data)
-    df.to_parquet(filepath, engine="pyarrow", compression="snappy")
+    # Native timestamps, booleans and dictionary-encoded categories instead of
+    # strings. Rows are converted to Arrow one row group at a time so only a
+    # slice of the table is ever held twice.
+    schema = arrow_schema(data)
+    with pq.ParquetWriter(
+        filepath,
+        schema,
+        compression="snappy",
+        use_dictionary=True,
+        write_statistics=True,
+    ) as writer:
+        for start in range(0, num_rows(data), PARQUET_ROW_GROUP_SIZE):
+            rows = slice_rows(data, start, start + PARQUET_ROW_GROUP_SIZE)
+            writer.write_table(to_arrow(rows, schema))
 
     print(f"  ✓ Saved Parquet: {filepath.name}")
 
 
-def save_to_json(data: List[Dict], filepath: Path):
-    """Save data to JSON format."""
-    if not data:
+def save_to_json(data: Table, filepath: Path):
+    """Save data to JSON format (one object per row)."""
+    if not num_rows(data):
         return
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    data = export_columns(data)
+    keys = list(data.keys())
+    rows = [dict(zip(keys, row)) for row in zip(*data.values())]
+    filepath.write_bytes(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
 
     print(f"  ✓ Saved JSON: {filepath.name}")
 
 
+# Export format -> (writer, label); each format goes to data/<format>/
+EXPORTERS = {
+    "csv": (save_to_csv, "CSV"),
+    "parquet": (save_to_parquet, "Parquet"),
+    "json": (save_to_json, "JSON"),
+}
+
+
 def main():
     """Generate all test data and export in multiple formats."""
+    import argparse
+
+    def formats(value: str) -> List[str]:
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(EXPORTERS))
+        if unknown or not names:
+            raise argparse.ArgumentTypeError(
+                f"expected a comma-separated subset of {','.join(EXPORTERS)}"
+            )
+        return list(dict.fromkeys(names))
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--formats",
+        type=formats,
+        default=list(EXPORTERS),
+        help="comma-separated export formats (default: csv,parquet,json)",
+    )
+    args = parser.parse_args()
+
     print("\n" + "=" * 60)
     print("KuzuDB Authorization Test Data Generator")
     print("=" * 60)
@@ -321,15 +556,21 @@ def main():
     print(f"  Users: {NUM_USERS}")
     print(f"  Resources: {NUM_RESOURCES}")
     print(f"  Groups: {NUM_GROUPS}")
+    print(f"  Formats: {', '.join(args.formats)}")
     print(
         f"  Estimated edges: ~{NUM_USERS * AVG_MEMBERSHIPS_PER_USER + NUM_RESOURCES * (AVG_USER_PERMISSIONS_PER_RESOURCE + AVG_GROUP_PERMISSIONS_PER_RESOURCE) + NUM_GROUPS * AVG_GROUP_HIERARCHY_DEPTH:.0f}"
     )
     print()
 
-    # Generate nodes
-    users = generate_users(NUM_USERS)
-    resources = generate_resources(NUM_RESOURCES)
-    groups = generate_groups(NUM_GROUPS)
+    # Generate nodes; creation times for all of them come from one draw
+    created_at = random_timestamps(
+        TWO_YEARS_AGO, NUM_USERS + NUM_RESOURCES + NUM_GROUPS
+    )
+    users = generate_users(NUM_USERS, created_at[:NUM_USERS])
+    resources = generate_resources(
+        NUM_RESOURCES, created_at[NUM_USERS : NUM_USERS + NUM_RESOURCES]
+    )
+    groups = generate_groups(NUM_GROUPS, created_at[NUM_USERS + NUM_RESOURCES :])
 
     # Generate edges
     member_of = generate_member_of_edges(users, groups)
@@ -344,66 +585,53 @@ def main():
     # Get base directory
     base_dir = Path(__file__).parent.parent / "data"
 
-    # Export to CSV
-    print("\nCSV Format:")
-    csv_dir = base_dir / "csv"
-    save_to_csv(users, csv_dir / "users.csv")
-    save_to_csv(resources, csv_dir / "resources.csv")
-    save_to_csv(groups, csv_dir / "groups.csv")
-    save_to_csv(member_of, csv_dir / "member_of.csv")
-    save_to_csv(user_permissions, csv_dir / "user_permissions.csv")
-    save_to_csv(group_permissions, csv_dir / "group_permissions.csv")
-    save_to_csv(inherits_from, csv_dir / "inherits_from.csv")
-
-    # Export to Parquet
-    print("\nParquet Format:")
-    parquet_dir = base_dir / "parquet"
-    save_to_parquet(users, parquet_dir / "users.parquet")
-    save_to_parquet(resources, parquet_dir / "resources.parquet")
-    save_to_parquet(groups, parquet_dir / "groups.parquet")
-    save_to_parquet(member_of, parquet_dir / "member_of.parquet")
-    save_to_parquet(user_permissions, parquet_dir / "user_permissions.parquet")
-    save_to_parquet(group_permissions, parquet_dir / "group_permissions.parquet")
-    save_to_parquet(inherits_from, parquet_dir / "inherits_from.parquet")
-
-    # Export to JSON
-    print("\nJSON Format:")
-    json_dir = base_dir / "json"
-    save_to_json(users, json_dir / "users.json")
-    save_to_json(resources, json_dir / "resources.json")
-    save_to_json(groups, json_dir / "groups.json")
-    save_to_json(member_of, json_dir / "member_of.json")
-    save_to_json(user_permissions, json_dir / "user_permissions.json")
-    save_to_json(group_permissions, json_dir / "group_permissions.json")
-    save_to_json(inherits_from, json_dir / "inherits_from.json")
+    tables = {
+        "users": users,
+        "resources": resources,
+        "groups": groups,
+        "member_of": member_of,
+        "user_permissions": user_permissions,
+        "group_permissions": group_permissions,
+        "inherits_from": inherits_from,
+    }
+
+    # Every file is independent; Arrow's Parquet writer releases the GIL, so
+    # threads overlap it with the other exports without pickling the tables
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(EXPORTERS[ext][0], data, base_dir / ext / f"{name}.{ext}")
+            for ext in args.formats
+            for name, data in tables.items()
+        ]
+        for future in futures:
+            future.result()
 
     # Summary
-    total_nodes = len(users) + len(resources) + len(groups)
+    total_nodes = num_rows(users) + num_rows(resources) + num_rows(groups)
     total_edges = (
-        len(member_of)
-        + len(user_permissions)
-        + len(group_permissions)
-        + len(inherits_from)
+        num_rows(member_of)
+        + num_rows(user_permissions)
+        + num_rows(group_permissions)
+        + num_rows(inherits_from)
     )
 
     print(f"\n{'='*60}")
     print("Summary")
     print("=" * 60)
     print(f"\nNodes: {total_nodes:,}")
-    print(f"  • Users: {len(users):,}")
-    print(f"  • Resources: {len(resources):,}")
-    print(f"  • Groups: {len(groups):,}")
+    print(f"  • Users: {num_rows(users):,}")
+    print(f"  • Resources: {num_rows(resources):,}")
+    print(f"  • Groups: {num_rows(groups):,}")
     print(f"\nEdges: {total_edges:,}")
-    print(f"  • MEMBER_OF: {len(member_of):,}")
-    print(f"  • HAS_PERMISSION (User): {len(user_permissions):,}")
-    print(f"  • HAS_PERMISSION (Group): {len(group_permissions):,}")
-    print(f"  • INHERITS_FROM: {len(inherits_from):,}")
+    print(f"  • MEMBER_OF: {num_rows(member_of):,}")
+    print(f"  • HAS_PERMISSION (User): {num_rows(user_permissions):,}")
+    print(f"  • HAS_PERMISSION (Group): {num_rows(group_permissions):,}")
+    print(f"  • INHERITS_FROM: {num_rows(inherits_from):,}")
 
     print(f"\n✅ Data generation complete!")
     print(f"\nData exported to:")
-    print(f"  • CSV: {csv_dir}")
-    print(f"  • Parquet: {parquet_dir}")
-    print(f"  • JSON: {json_dir}")
+    for ext in args.formats:
+        print(f"  • {EXPORTERS[ext][1]}: {base_dir / ext}")
 
 
 if __name__ == "__main__":
@@ -213,6 +213,7 @@ echo ""
 echo "Results saved:"
 echo "  • Python: results/loading_benchmark_results.json"
 echo "  • Python: results/query_benchmark_results.json"
+echo "  • Python: results/query_benchmark_variants.json (batched/LIMIT 1/filtered variants)"
 echo "  • Node.js: results/nodejs_loading_benchmark_results.json"
 echo "  • Node.js: results/nodejs_query_benchmark_results.json"
 echo "  • WASM: $LATEST_WASM_RESULT"